@@ -1,14 +1,52 @@
-import math
+import io
+import logging
 import os
-import time
-import json
-import xml.etree.ElementTree as ElementTree
-from html import unescape
-from typing import Dict, Optional
+import re
+from itertools import chain
+from typing import Dict, Iterable, Iterator, Optional
 import html
 from pytube import request
 from pytube.helpers import safe_filename, target_directory
 
+try:
+    # lxml's C parser is considerably faster on long transcripts
+    from lxml import etree as ElementTree
+
+    # Never expand external entities from the downloaded track; older lxml
+    # versions resolve them by default
+    _ITERPARSE_KWARGS = {"resolve_entities": False}
+except ImportError:  # pragma: no cover
+    import xml.etree.ElementTree as ElementTree
+
+    _ITERPARSE_KWARGS = {}
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+# Runs of newlines and spaces inside a cue collapse to a single space
+_WS_RE = re.compile(r"[\n ]+")
+
+# The entities YouTube escapes caption text with; anything else found by
+# _ENTITY_RE is left to html.unescape
+_ENTITIES = {"&amp;": "&", "&lt;": "<", "&gt;": ">", "&quot;": '"', "&#39;": "'"}
+_ENTITY_RE = re.compile(r"&#?\w+;")
+
+
+def _unescape_entity(match) -> str:
+    entity = match.group(0)
+    return _ENTITIES.get(entity) or html.unescape(entity)
+
+
+def _unescape(text: str) -> str:
+    """Unescape the HTML entities left in caption text."""
+    if "&" not in text:
+        return text
+    return _ENTITY_RE.sub(_unescape_entity, text)
+
 
 class Caption:
     """Container for caption tracks."""
@@ -48,7 +86,7 @@ class Caption:
         """Download and parse the json caption tracks."""
         json_captions_url = self.url.replace('fmt=srv3','fmt=json3')
         text = request.get(json_captions_url)
-        parsed = json.loads(text)
+        parsed = _json_loads(text)
         assert parsed['wireMagic'] == 'pb3', 'Unexpected captions format'
         return parsed
 
@@ -60,6 +98,21 @@ class Caption:
         """
         return self.xml_caption_to_srt(self.xml_captions)
 
+    @staticmethod
+    def _fmt_ms(ms: int) -> str:
+        """Convert a millisecond offset into proper srt format.
+
+        :rtype: str
+        :returns:
+            SubRip Subtitle (str) formatted time duration.
+
+        _fmt_ms(3890) -> '00:00:03,890'
+        """
+        hours, ms = divmod(ms, 3600000)
+        minutes, ms = divmod(ms, 60000)
+        seconds, ms = divmod(ms, 1000)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d},{ms:03d}"
+
     @staticmethod
     def float_to_srt_time_format(d: float) -> str:
         """Convert decimal durations into proper srt format.
@@ -70,95 +123,149 @@ class Caption:
 
         float_to_srt_time_format(3.89) -> '00:00:03,890'
         """
-        fraction, whole = math.modf(d)
-        time_fmt = time.strftime("%H:%M:%S,", time.gmtime(whole))
-        ms = f"{fraction:.3f}".replace("0.", "")
-        return time_fmt + ms
-    def convert_time(self, ms):
-        """Convert milliseconds to SRT time format."""
-        hours = ms // 3600000
-        minutes = (ms % 3600000) // 60000
-        seconds = (ms % 60000) // 1000
-        milliseconds = ms % 1000
-        return f"{hours:02}:{minutes:02}:{seconds:02},{milliseconds:03}"
+        return Caption._fmt_ms(round(d * 1000))
+
+    @staticmethod
+    def _iter_elements(xml_captions: str, tags: tuple) -> Iterator:
+        """Incrementally parse xml caption tracks, yielding ``tags`` elements.
+
+        Each element is cleared and detached from its parent once the
+        caller has consumed it, so memory use does not grow with the length
+        of the transcript.
+
+        :param str xml_captions:
+            XML formatted caption tracks.
+        :param tuple tags:
+            Names of the elements to yield.
+        """
+        parents = []
+        source = io.BytesIO(xml_captions.encode("utf-8"))
+        events = ElementTree.iterparse(source, events=("start", "end"), **_ITERPARSE_KWARGS)
+        for event, element in events:
+            if event == "start":
+                parents.append(element)
+                continue
+            parents.pop()
+            if element.tag not in tags:
+                continue
+            yield element
+            element.clear()
+            if parents:
+                parents[-1].remove(element)
+
+    def _iter_text_cues(self, elements: Iterable) -> Iterator[str]:
+        """Yield srt cues from the legacy <text start="" dur=""> schema.
+
+        :param elements:
+            The <text> elements of the caption track.
+        """
+        float_fmt = self.float_to_srt_time_format
+        prev_end, prev_end_srt = None, None
+        for i, child in enumerate(elements, start=1):
+            attr = child.attrib
+            caption = _unescape(_WS_RE.sub(" ", child.text or ""))
+            duration = float(attr.get("dur", 0.0))
+            start = float(attr["start"])
+            end = start + duration
+            # Cues usually start where the previous one ended
+            start_srt = prev_end_srt if start == prev_end else float_fmt(start)
+            prev_end, prev_end_srt = end, float_fmt(end)
+            yield f"{i}\n{start_srt} --> {prev_end_srt}\n{caption}"
+
+    def _iter_p_cues(self, elements: Iterable) -> Iterator[str]:
+        """Yield srt cues from the timedtext format 3 <p t="" d=""> schema.
+
+        :param elements:
+            The <p> elements of the caption track.
+        """
+        counter = 1
+        fmt = self._fmt_ms
+        _int = int
+        prev_end_time, prev_end_srt = None, None
+        for p in elements:
+            if len(p):
+                # Auto-generated tracks nest the words in <s> segments
+                inner_segments = []
+                for s in p:
+                    seg_text = _unescape(s.text or "")
+                    inner_segments.append(seg_text)
+                caption_text = ''.join(inner_segments).strip()
+            else:
+                caption_text = _unescape(p.text or "").replace("\n", " ").strip()
+
+            # Skip empty captions
+            if not caption_text:
+                continue
+
+            # Initial start time and duration (in milliseconds)
+            attr = p.attrib
+            start_time = _int(attr['t'])
+            duration = _int(attr.get('d', 0))
+            end_time = start_time + duration
+
+            # Convert times into SRT format (hours:minutes:seconds,milliseconds),
+            # reusing the previous end time when this cue starts right on it
+            if start_time == prev_end_time:
+                start_srt = prev_end_srt
+            else:
+                start_srt = fmt(start_time)
+            end_srt = fmt(end_time)
+            prev_end_time, prev_end_srt = end_time, end_srt
+
+            yield f"{counter}\n{start_srt} --> {end_srt}\n{caption_text}"
+            counter += 1
+
+    def _iter_srt_lines(self, xml_captions: str) -> Iterator[str]:
+        """Yield the cues of xml caption tracks converted to srt, one by one.
+
+        The schema, legacy <text> or timedtext format 3 <p>, is picked from
+        the first cue element, so the document is only parsed once.
+
+        :param str xml_captions:
+            XML formatted caption tracks.
+        """
+        elements = self._iter_elements(xml_captions, ("text", "p"))
+        first = next(elements, None)
+        if first is None:
+            return
+        tag = first.tag
+        cues = (element for element in chain((first,), elements) if element.tag == tag)
+        if tag == "text":
+            yield from self._iter_text_cues(cues)
+        else:
+            yield from self._iter_p_cues(cues)
+
     def xml_caption_to_srt(self, xml_captions: str) -> str:
         """Convert xml caption tracks to "SubRip Subtitle (srt)".
 
         :param str xml_captions:
             XML formatted caption tracks.
         """
-        segments = []
-        root = ElementTree.fromstring(xml_captions)
         try:
-            for i, child in enumerate(list(root)):
-                text = child.text or ""
-                caption = unescape(text.replace("\n", " ").replace("  ", " "),)
-                try:
-                    duration = float(child.attrib["dur"])
-                except KeyError:
-                    duration = 0.0
-                start = float(child.attrib["start"])
-                end = start + duration
-                sequence_number = i + 1  # convert from 0-indexed to 1.
-                line = "{seq}\n{start} --> {end}\n{text}\n".format(
-                    seq=sequence_number,
-                    start=self.float_to_srt_time_format(start),
-                    end=self.float_to_srt_time_format(end),
-                    text=caption,
-                )
-                segments.append(line)
-        except Exception as e:
-            print("First pass srt failure", e)
-            try:
-                srt=[]
-                counter = 1
-                for p in root.iter('p'):
-                    # Initial start time and duration
-                    start_time = int(p.attrib['t'])
-                    duration = int(p.attrib.get('d', '0'))
-                    end_time = start_time + duration
-                    
-                    # Convert times into SRT format (hours:minutes:seconds,milliseconds)
-                    start_srt = self.convert_time(start_time)
-                    end_srt = self.convert_time(end_time)
-                    
-                    # Construct caption text, considering nested <s> tags for segments
-                    inner_segments = []
-                    for s in p:
-                        seg_text = s.text.replace('&#39;', "'")  # Basic HTML entity handling
-                        if 't' in s.attrib:  # If segment has its own start time, adjust the base start time
-                            seg_start = start_time + int(s.attrib['t'])
-                            seg_text = f"{seg_text}"  # Placeholder for potential future formatting
-                        inner_segments.append(seg_text)
-                    caption_text = ''.join(inner_segments).strip()
-                    
-                    # Skip empty captions
-                    if not caption_text:
-                        continue
-                    
-                    # Append to SRT list
-                    srt.append(f"{counter}\n{start_srt} --> {end_srt}\n{caption_text}\n")
-                    counter += 1
-                if len(srt) >0:
-                    return '\n'.join(srt).strip()
-                else:
-                    srt_content = []
-
-                    for i, p in enumerate(root.find('body'), start=1):
-                        start_time = int(p.attrib['t'])
-                        duration = int(p.attrib['d'])
-                        end_time = start_time + duration
-                        start_srt = self.convert_time(start_time)
-                        end_srt = self.convert_time(end_time)
-                        text = html.unescape(p.text).replace("\n", " ").strip()
-
-                        srt_content.append(f"{i}\n{start_srt} --> {end_srt}\n{text}\n")
-
-                    return "\n".join(srt_content)
-            except Exception as e:
-                print(e)
-                return None
-        return "\n".join(segments).strip()
+            return "\n\n".join(self._iter_srt_lines(xml_captions)).strip()
+        except Exception:
+            logger.debug("Unable to convert the captions to srt", exc_info=True)
+            return None
+
+    def write_srt(self, file_handle) -> None:
+        """Write the captions as "SubRip Subtitle (srt)" to a binary file.
+
+        Cues are encoded and written as they are converted, so the whole
+        srt document is never held in memory.
+
+        :param file_handle:
+            File object opened for writing in binary mode.
+        """
+        # Each cue is written once the next one is known, so the last one
+        # can be stripped the way xml_caption_to_srt strips the document
+        previous = None
+        for line in self._iter_srt_lines(self.xml_captions):
+            if previous is not None:
+                file_handle.write(previous.encode("utf-8"))
+                file_handle.write(b"\n\n")
+            previous = line
+        if previous is not None:
+            file_handle.write(previous.rstrip().encode("utf-8"))
 
     def download(
         self,
@@ -209,11 +316,11 @@ class Caption:
 
         file_path = os.path.join(target_directory(output_path), filename)
 
-        with open(file_path, "w", encoding="utf-8") as file_handle:
+        with open(file_path, "wb") as file_handle:
             if srt:
-                file_handle.write(self.generate_srt_captions())
+                self.write_srt(file_handle)
             else:
-                file_handle.write(self.xml_captions)
+                file_handle.write(self.xml_captions.encode("utf-8"))
 
         return file_path
 
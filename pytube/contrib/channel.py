@@ -1,17 +1,238 @@
 # -*- coding: utf-8 -*-
 """Module for interacting with a user's youtube channel."""
+import asyncio
 import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Optional, Tuple
 
 from pytube import Playlist, extract, request
-from pytube.helpers import uniqueify
+from pytube.exceptions import PytubeError
 from pytube.innertube import InnerTube
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+# Where the /about metadata lives inside the engagement panel of ytInitialData
+_ABOUT_PATH = (
+    "onResponseReceivedEndpoints",
+    0,
+    "showEngagementPanelEndpoint",
+    "engagementPanel",
+    "engagementPanelSectionListRenderer",
+    "content",
+    "sectionListRenderer",
+    "contents",
+    0,
+    "itemSectionRenderer",
+    "contents",
+    0,
+    "aboutChannelRenderer",
+    "metadata",
+    "aboutChannelViewModel",
+)
+
+# Where the video list lives in the json passed to Channel._extract_videos
+_VIDEOS_PATHS = (
+    # the json tree structure, if the json was extracted from html
+    (
+        "contents",
+        "twoColumnBrowseResultsRenderer",
+        "tabs",
+        1,
+        "tabRenderer",
+        "content",
+        "sectionListRenderer",
+        "contents",
+        0,
+        "itemSectionRenderer",
+        "contents",
+        0,
+        "gridRenderer",
+        "items",
+    ),
+    # the json tree structure, if the json was directly sent by the server
+    # in a continuation response
+    (
+        1,
+        "response",
+        "onResponseReceivedActions",
+        0,
+        "appendContinuationItemsAction",
+        "continuationItems",
+    ),
+    # the same continuation response, no longer a list and no longer
+    # wrapped in a "response" key
+    (
+        "onResponseReceivedActions",
+        0,
+        "appendContinuationItemsAction",
+        "continuationItems",
+    ),
+)
+
+# Literal text preceding the ytInitialData / ytcfg payloads in a page
+_YT_INITIAL_DATA_ANCHOR = "var ytInitialData = "
+_YTCFG_ANCHOR = "ytcfg.set("
+
+# Precompiled fallbacks for pages not laid out exactly like that. The
+# patterns stop right before the opening brace; the object itself is left to
+# JSONDecoder.raw_decode rather than a backtracking {.*?} match.
+_YT_INITIAL_DATA_RE = re.compile(r"var ytInitialData\s*=\s*(?={)")
+_YTCFG_RE = re.compile(r"ytcfg\.set\(\s*(?={)")
+
+# Sent along with requests made through a user supplied session, matching
+# the headers pytube.request uses
+_SESSION_HEADERS = {"User-Agent": "Mozilla/5.0", "accept-language": "en-US,en"}
+
+# Seconds the html of a channel page is kept in a user supplied cache
+_CACHE_EXPIRE = 900
+
+# Multipliers for the abbreviated counts YouTube displays, e.g. "1.2M"
+_SUFFIXES = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+
+# Channel section name -> (url attribute, html cache attribute)
+_PAGES = {
+    "videos": ("videos_url", "_html"),
+    "about": ("about_url", "_about_html"),
+    "playlists": ("playlists_url", "_playlists_html"),
+    "community": ("community_url", "_community_html"),
+    "channels": ("featured_channels_url", "_featured_channels_html"),
+    "shorts": ("shorts_url", "_shorts_html"),
+}
+_SECTIONS = ("videos", "about", "shorts", "playlists", "community", "channels")
+
+
+def _walk(obj, path):
+    """Follow a sequence of keys and indices down a nested json object.
+
+    :raises KeyError, IndexError, TypeError:
+        If the path does not exist in ``obj``.
+    """
+    for key in path:
+        obj = obj[key]
+    return obj
+
+
+def _parse_rich_item(rich_item_renderer, time_to_seconds):
+    """Parse a video or short from a channel tab's richItemRenderer.
+
+    :rtype: dict or None
+    """
+    rich_item = rich_item_renderer["content"]
+    item = rich_item.get("videoRenderer") or rich_item.get("reelItemRenderer")
+    if not item:
+        return None
+
+    sub_content = {"video_id": item["videoId"]}
+    if item.get("title"):
+        sub_content["title"] = " ".join(run["text"] for run in item["title"]["runs"])
+    elif item.get("headline", {}).get("simpleText"):
+        sub_content["title"] = item["headline"]["simpleText"]
+
+    view_count = item.get("viewCountText", {}).get("simpleText")
+    if view_count:
+        sub_content["views"] = view_count.split(" ", 1)[0].replace(",", "")
+
+    length = item.get("lengthText", {}).get("simpleText")
+    if length:
+        try:
+            sub_content["duration"] = time_to_seconds(length)
+        except ValueError:
+            sub_content["duration"] = None
+
+    description_runs = item.get("descriptionSnippet", {}).get("runs")
+    if description_runs:
+        sub_content["description"] = " ".join(run["text"] for run in description_runs)
+    return sub_content
+
+
+def _parse_item_section(item_section_renderer):
+    """Parse a video from a channel search result's itemSectionRenderer.
+
+    :rtype: dict or None
+    """
+    section_contents = item_section_renderer.get("contents") or [{}]
+    video_renderer = section_contents[0].get("videoRenderer")
+    if not video_renderer:
+        return None
+
+    sub_content = {
+        "video_id": video_renderer["videoId"],
+        "title": " ".join(run["text"] for run in video_renderer["title"]["runs"]),
+    }
+
+    description_runs = video_renderer.get("descriptionSnippet", {}).get("runs")
+    sub_content["description"] = (
+        " ".join(run["text"] for run in description_runs) if description_runs else None
+    )
+
+    view_count = video_renderer.get("viewCountText", {}).get("simpleText", "")
+    views = view_count.split(" ", 1)[0].replace(",", "")
+    sub_content["views"] = int(views) if views.isdecimal() else None
+    return sub_content
+
+
+def _parse_continuation(continuation_item_renderer):
+    """Get the token for the next page from a continuationItemRenderer.
+
+    :rtype: str or None
+    """
+    return (
+        continuation_item_renderer.get("continuationEndpoint", {})
+        .get("continuationCommand", {})
+        .get("token")
+    )
+
+
+class SearchPage:
+    """A page of channel search results.
+
+    Unless created with ``prefetch=False``, the next page is requested in
+    the background as soon as this one is created, see
+    :meth:`Channel.search_videos`. The page also unpacks like the usual
+    ``(videos, continuation_token)`` tuple.
+    """
+
+    def __init__(self, channel, query, videos, continuation_token, future=None):
+        self.channel = channel
+        self.query = query
+        self.videos = videos
+        self.continuation_token = continuation_token
+        self._future = future
+        self._next_page = None
+
+    def __iter__(self):
+        return iter((self.videos, self.continuation_token))
+
+    def next_page(self, prefetch=True):
+        """Get the next page of results, waiting for it if still in flight.
+
+        The page is only requested once, later calls return the same
+        :class:`SearchPage`.
+
+        :param bool prefetch:
+            (Optional) Start requesting the page after the next one in the
+            background. Defaults to True.
+        :rtype: SearchPage or None
+        :returns:
+            None if this is the last page.
+        """
+        if self._next_page is None and self.continuation_token:
+            if self._future is not None:
+                response = self._future.result()
+            else:
+                response = self.channel._browse(self.query, self.continuation_token)
+            self._next_page = self.channel._search_page(self.query, response, prefetch)
+        return self._next_page
+
 
 class Channel(Playlist):
     def __init__(
@@ -21,13 +242,30 @@ class Channel(Playlist):
         use_oauth: bool = False,
         allow_oauth_cache: bool = True,
         innertube=None,
+        session=None,
+        cache=None,
     ):
         """Construct a :class:`Channel <Channel>`.
 
         :param str url:
             A valid YouTube channel URL.
         :param proxies:
-            (Optional) A dictionary of proxies to use for web requests.
+            (Optional) A dictionary of proxies to use for web requests. They
+            are also passed to the ``get`` method of a ``session`` which takes
+            per-request proxies, such as a ``requests.Session``.
+        :param session:
+            (Optional) An http session with a requests-style ``get`` method,
+            such as a ``requests.Session`` or an ``httpx.Client``. The channel
+            pages are downloaded through it, so its connections are kept
+            alive and reused between them. The session is not closed by the
+            channel. Sessions without a ``proxies`` attribute, such as an
+            ``httpx.Client``, own their transport configuration and keep it:
+            ``proxies`` is not passed to them.
+        :param cache:
+            (Optional) A ``diskcache.Cache`` (or any object with the same
+            ``get``/``set``/``delete`` methods) to keep the downloaded html of
+            the channel pages in for 15 minutes, keyed by channel and page.
+            Disabled by default.
         """
         super().__init__(url, proxies)
 
@@ -35,12 +273,10 @@ class Channel(Playlist):
 
         self.channel_url = f"https://www.youtube.com{self.channel_uri}"
 
-        self.videos_url = self.channel_url + "/videos"
-        self.playlists_url = self.channel_url + "/playlists"
-        self.community_url = self.channel_url + "/community"
-        self.featured_channels_url = self.channel_url + "/channels"
-        self.about_url = self.channel_url + "/about"
-        self.shorts_url = self.channel_url + "/shorts"
+        # videos_url, about_url, playlists_url, community_url,
+        # featured_channels_url and shorts_url
+        for section, (url_attr, _) in _PAGES.items():
+            setattr(self, url_attr, f"{self.channel_url}/{section}")
 
         # Possible future additions
         self._playlists_html = None
@@ -54,9 +290,108 @@ class Channel(Playlist):
         self._videos_json = None
         self._shorts_json = None
         self._about_metadata_json = None
+        self._metadata_renderer_json = None
+        self._channel_name = None
+        self._channel_id = None
+        self._vanity_url = None
+        self._description = None
+        self._total_view_count = None
+        self._date_joined = None
+        self._country = None
+        self._video_count = None
         self.use_oauth = use_oauth
         self.allow_oauth_cache = allow_oauth_cache
         self.innertube = innertube
+        self.proxies = proxies
+        self.session = session
+        self.cache = cache
+        self._prefetch_executor = None
+
+    def _get(self, url):
+        """Send an http GET request, through :attr:`session` if one is set.
+
+        :param str url:
+            The URL to perform the GET request for.
+        :rtype: str
+        :raises PytubeError:
+            If the request made through :attr:`session` fails, wrapping the
+            error raised by the session library.
+        """
+        if self.session is None:
+            return request.get(url)
+
+        kwargs = {"headers": _SESSION_HEADERS}
+        # requests-style sessions take per-request proxies, httpx-style
+        # clients only accept them when they are created
+        if self.proxies and hasattr(self.session, "proxies"):
+            kwargs["proxies"] = self.proxies
+        try:
+            response = self.session.get(url, **kwargs)
+            response.raise_for_status()
+        except Exception as e:
+            raise PytubeError(f"GET {url} failed: {e}") from e
+        return response.text
+
+    def _cache_key(self, section):
+        return f"channel:{self.channel_uri}:{section}_html:v1"
+
+    def _get_section(self, section):
+        """Download the html of a channel section, going through :attr:`cache`.
+
+        :param str section:
+            Name of the section, see :meth:`prefetch`.
+        :rtype: str
+        """
+        url = getattr(self, _PAGES[section][0])
+        if self.cache is None:
+            return self._get(url)
+
+        key = self._cache_key(section)
+        html = self.cache.get(key)
+        if html is None:
+            html = self._get(url)
+            self.cache.set(key, html, expire=_CACHE_EXPIRE)
+        return html
+
+    def invalidate(self, section=None):
+        """Evict the html of channel sections from :attr:`cache`.
+
+        Pages this instance has already loaded are kept in memory.
+
+        :param str section:
+            (Optional) Name of the section to evict, see :meth:`prefetch`.
+            Evicts every section if not specified.
+        """
+        if self.cache is None:
+            return
+        for name in _SECTIONS if section is None else (section,):
+            self.cache.delete(self._cache_key(name))
+
+    @property
+    def initial_data(self):
+        """Extract the initial data from the /videos page html.
+
+        :rtype: dict
+        """
+        if self._initial_data:
+            return self._initial_data
+        try:
+            self._initial_data = self.extract_yt_initial_data(self.html)
+        except ValueError:
+            self._initial_data = None
+        if self._initial_data is None:
+            # Pages laid out differently, e.g. with window["ytInitialData"],
+            # are left to the generic (slower) extractor
+            self._initial_data = extract.initial_data(self.html)
+        return self._initial_data
+
+    @property
+    def _metadata_renderer(self):
+        if self._metadata_renderer_json is None:
+            self._metadata_renderer_json = self.initial_data["metadata"][
+                "channelMetadataRenderer"
+            ]
+        return self._metadata_renderer_json
 
     @property
     def channel_name(self):
@@ -64,7 +399,9 @@ class Channel(Playlist):
 
         :rtype: str
         """
-        return self.initial_data["metadata"]["channelMetadataRenderer"]["title"]
+        if self._channel_name is None:
+            self._channel_name = self._metadata_renderer["title"]
+        return self._channel_name
 
     @property
     def channel_id(self):
@@ -74,7 +411,9 @@ class Channel(Playlist):
 
         :rtype: str
         """
-        return self.initial_data["metadata"]["channelMetadataRenderer"]["externalId"]
+        if self._channel_id is None:
+            self._channel_id = self._metadata_renderer["externalId"]
+        return self._channel_id
 
     @property
     def vanity_url(self):
@@ -84,9 +423,27 @@ class Channel(Playlist):
 
         :rtype: str
         """
-        return self.initial_data["metadata"]["channelMetadataRenderer"].get(
-            "vanityChannelUrl", None
-        )  # noqa:E501
+        if self._vanity_url is None:
+            self._vanity_url = self._metadata_renderer.get("vanityChannelUrl", None)
+        return self._vanity_url
+
+    def _about_field(self, key):
+        """Get a field of the /about metadata, sparing the /about request.
+
+        The channelMetadataRenderer of the /videos page carries some of the
+        same fields, such as the description. It is used when the /videos
+        page has already been decoded or the /about page has not been
+        downloaded yet, so that only one of the two pages is ever needed.
+
+        :raises KeyError, TypeError:
+            If the field is not found.
+        """
+        if self._initial_data or not self._about_html:
+            try:
+                return self._metadata_renderer[key]
+            except (KeyError, TypeError, ValueError):
+                pass
+        return self.about_metadata_json[key]
 
     @property
     def about_metadata_json(self):
@@ -94,39 +451,15 @@ class Channel(Playlist):
 
         :rtype: str
         """
-        if self._about_metadata_json:
+        if self._about_metadata_json is not None:
             return self._about_metadata_json
         else:
             if self.about_json.get("onResponseReceivedEndpoints"):
                 try:
-                    self._about_metadata_json = self.about_json[
-                        "onResponseReceivedEndpoints"
-                    ][0]["showEngagementPanelEndpoint"]["engagementPanel"][
-                        "engagementPanelSectionListRenderer"
-                    ][
-                        "content"
-                    ][
-                        "sectionListRenderer"
-                    ][
-                        "contents"
-                    ][
-                        0
-                    ][
-                        "itemSectionRenderer"
-                    ][
-                        "contents"
-                    ][
-                        0
-                    ][
-                        "aboutChannelRenderer"
-                    ][
-                        "metadata"
-                    ][
-                        "aboutChannelViewModel"
-                    ]
+                    self._about_metadata_json = _walk(self.about_json, _ABOUT_PATH)
                     return self._about_metadata_json
-                except Exception as e:
-                    print(e)
+                except (KeyError, IndexError, TypeError):
+                    logger.debug("/about metadata not found", exc_info=True)
                     return None
             elif self.about_json.get("metadata"):
                 self._about_metadata_json = self.about_json["metadata"][
@@ -140,7 +473,9 @@ class Channel(Playlist):
 
         :rtype: str
         """
-        return self.about_metadata_json["description"]
+        if self._description is None:
+            self._description = self._about_field("description")
+        return self._description
 
     @property
     def total_view_count(self):
@@ -148,11 +483,13 @@ class Channel(Playlist):
 
         :rtype: str
         """
-        return int(
-            self.about_metadata_json["viewCountText"]
-            .split(" views")[0]
-            .replace(",", "")
-        )
+        if self._total_view_count is None:
+            self._total_view_count = int(
+                self.about_metadata_json["viewCountText"]
+                .split(" ", 1)[0]
+                .replace(",", "")
+            )
+        return self._total_view_count
 
     @property
     def date_joined(self):
@@ -160,16 +497,18 @@ class Channel(Playlist):
 
         :rtype: datetime object
         """
+        if self._date_joined is not None:
+            return self._date_joined
         try:
-            date_obj = datetime.strptime(
+            self._date_joined = datetime.strptime(
                 self.about_metadata_json["joinedDateText"]["content"].split("Joined ")[
                     -1
                 ],
                 "%b %d, %Y",
             )
-            return date_obj
-        except Exception as e:
-            print(e)
+            return self._date_joined
+        except Exception:
+            logger.debug("Unable to parse the channel join date", exc_info=True)
             return None
 
     @property
@@ -180,7 +519,7 @@ class Channel(Playlist):
         """
         if self._html:
             return self._html
-        self._html = request.get(self.videos_url)
+        self._html = self._get_section("videos")
         return self._html
 
     @property
@@ -194,7 +533,7 @@ class Channel(Playlist):
         if self._playlists_html:
             return self._playlists_html
         else:
-            self._playlists_html = request.get(self.playlists_url)
+            self._playlists_html = self._get_section("playlists")
             return self._playlists_html
 
     @property
@@ -208,7 +547,7 @@ class Channel(Playlist):
         if self._community_html:
             return self._community_html
         else:
-            self._community_html = request.get(self.community_url)
+            self._community_html = self._get_section("community")
             return self._community_html
 
     @property
@@ -222,7 +561,7 @@ class Channel(Playlist):
         if self._featured_channels_html:
             return self._featured_channels_html
         else:
-            self._featured_channels_html = request.get(self.featured_channels_url)
+            self._featured_channels_html = self._get_section("channels")
             return self._featured_channels_html
 
     @property
@@ -261,34 +600,29 @@ class Channel(Playlist):
         if self._videos_json:
             return self._videos_json
         else:
-            self._videos_json = self.extract_yt_initial_data(self.html)
+            # initial_data decodes ytInitialData from this same page for the
+            # channel metadata, so don't decode it a second time
+            self._videos_json = self.initial_data
             return self._videos_json
 
-    def _find_content_list(self, data):
-        if data.get("contents"):
-            for tab in data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"]:
-                if tab.get("tabRenderer", {}).get("content"):
-
-                    if (
-                        tab["tabRenderer"]["content"]
-                        .get("richGridRenderer", {})
-                        .get("contents")
-                    ):
-                        return tab["tabRenderer"]["content"]["richGridRenderer"][
-                            "contents"
-                        ]
-                    if (
-                        tab["tabRenderer"]["content"]
-                        .get("sectionListRenderer", {})
-                        .get("contents")
-                    ):
-                        return tab["tabRenderer"]["content"]["sectionListRenderer"][
-                            "contents"
-                        ]
+    @staticmethod
+    def _find_content_list(data):
+        if not data.get("contents"):
+            return None
+
+        for tab in data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"]:
+            content = tab.get("tabRenderer", {}).get("content")
+            if not content:
+                continue
+            for renderer in ("richGridRenderer", "sectionListRenderer"):
+                contents = content.get(renderer, {}).get("contents")
+                if contents:
+                    return contents
 
         return None
 
-    def _find_searched_content_list(self, data):
+    @staticmethod
+    def _find_searched_content_list(data):
         if data.get("contents"):
             for tab in data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"]:
                 if not tab.get("expandableTabRenderer"):
@@ -303,114 +637,78 @@ class Channel(Playlist):
                 ].get("continuationItems")
         return None
 
-    def time_to_seconds(self, time_str):
-        parts = time_str.split(":")
-        parts = [int(part) for part in parts]
-
-        if len(parts) == 2:
-            minutes, seconds = parts
-            hours = 0
-        elif len(parts) == 3:
-            hours, minutes, seconds = parts
-        else:
-            raise ValueError(
-                "Invalid time format. Please use HH:MM:SS or MM:SS format."
-            )
+    @staticmethod
+    def time_to_seconds(time_str):
+        """Convert a "H:MM:SS" or "MM:SS" duration into seconds.
 
-        total_seconds = hours * 3600 + minutes * 60 + seconds
+        :rtype: int
+        :raises ValueError:
+            If a component of the duration is not a number.
+        """
+        total_seconds = 0
+        for part in time_str.split(":"):
+            total_seconds = total_seconds * 60 + int(part)
         return total_seconds
 
-    def _parse_contents(self, contents):
-        new_contents = []
-        continuation_token = None
+    def _iter_contents(self, contents):
+        """Lazily parse the videos out of a list of renderers.
+
+        :rtype: Iterator[dict]
+        """
+        time_to_seconds = self.time_to_seconds
         for content in contents:
-            sub_content = {}
-            if content.get("richItemRenderer"):
-                rich_item = content["richItemRenderer"]["content"]
-                if rich_item.get("videoRenderer"):
-                    renderer_type = "videoRenderer"
-                elif rich_item.get("reelItemRenderer"):
-                    renderer_type = "reelItemRenderer"
-                if not renderer_type:
+            renderer = content.get("richItemRenderer")
+            if renderer:
+                sub_content = _parse_rich_item(renderer, time_to_seconds)
+            else:
+                renderer = content.get("itemSectionRenderer")
+                if not renderer:
                     continue
+                sub_content = _parse_item_section(renderer)
 
-                item = rich_item[renderer_type]
-                sub_content["video_id"] = item["videoId"]
-                if item.get("title"):
-                    sub_content["title"] = " ".join(
-                        [run["text"] for run in item["title"]["runs"]]
-                    )
-                elif item.get("headline", {}).get("simpleText"):
-                    sub_content["title"] = item["headline"]["simpleText"]
-                try:
-                    if item.get("viewCountText", {}).get("simpleText"):
-                        sub_content["views"] = (
-                            item["viewCountText"]["simpleText"]
-                            .split(" ")[0]
-                            .replace(",", "")
-                        )
+            if sub_content is not None:
+                yield sub_content
 
-                except:
-                    sub_content["views"] = None
+    def _parse_contents(self, contents):
+        new_contents = list(self._iter_contents(contents))
+        continuation_token = None
+        # the continuation item closes the list
+        for content in reversed(contents):
+            renderer = content.get("continuationItemRenderer")
+            if renderer:
+                continuation_token = _parse_continuation(renderer)
+                break
+        return new_contents, continuation_token
 
-                try:
-                    if item.get("lengthText", {}).get("simpleText"):
-                        sub_content["duration"] = self.time_to_seconds(
-                            item["lengthText"]["simpleText"]
-                        )
+    def iter_recent_videos(self, limit=None):
+        """Lazily parse the videos listed on the /videos page.
 
-                except:
-                    sub_content["duration"] = None
-                try:
-                    if item.get("descriptionSnippet", {}).get("runs", []):
-                        sub_content["description"] = " ".join(
-                            [run["text"] for run in item["descriptionSnippet"]["runs"]]
-                        )
-                except:
-                    sub_content["description"] = None
-                new_contents.append(sub_content)
-            elif content.get("itemSectionRenderer"):
-                if content["itemSectionRenderer"]["contents"][0].get("videoRenderer"):
-                    video_renderer = content["itemSectionRenderer"]["contents"][0][
-                        "videoRenderer"
-                    ]
-                    sub_content["video_id"] = video_renderer["videoId"]
-                    sub_content["title"] = " ".join(
-                        [run["text"] for run in video_renderer["title"]["runs"]]
-                    )
-                    try:
-                        sub_content["description"] = " ".join(
-                            [
-                                run["text"]
-                                for run in video_renderer["descriptionSnippet"]["runs"]
-                            ]
-                        )
-                    except:
-                        sub_content["description"] = None
-                    try:
-                        sub_content["views"] = int(
-                            video_renderer["viewCountText"]["simpleText"]
-                            .split(" ")[0]
-                            .replace(",", "")
-                        )
-                    except:
-                        sub_content["views"] = None
-                new_contents.append(sub_content)
-            elif content.get("continuationItemRenderer"):
-                try:
-                    continuation_token = content["continuationItemRenderer"][
-                        "continuationEndpoint"
-                    ]["continuationCommand"]["token"]
-                except:
-                    pass
-        return new_contents, continuation_token
+        Only as many videos as are consumed get parsed.
+
+        :param int limit:
+            (Optional) Maximum number of videos to yield.
+        :rtype: Iterator[dict]
+        """
+        contents = self._find_content_list(self.videos_json) or ()
+        return islice(self._iter_contents(contents), limit)
+
+    def iter_recent_shorts(self, limit=None):
+        """Lazily parse the shorts listed on the /shorts page.
+
+        Only as many shorts as are consumed get parsed.
+
+        :param int limit:
+            (Optional) Maximum number of shorts to yield.
+        :rtype: Iterator[dict]
+        """
+        contents = self._find_content_list(self.shorts_json) or ()
+        return islice(self._iter_contents(contents), limit)
 
     @property
     def recent_videos(self):
         contents = self._find_content_list(self.videos_json)
         if contents:
-            updated_contents, _ = self._parse_contents(contents)
-            return updated_contents
+            return list(self._iter_contents(contents))
 
         return None
 
@@ -418,8 +716,7 @@ class Channel(Playlist):
     def recent_shorts(self):
         contents = self._find_content_list(self.shorts_json)
         if contents:
-            updated_contents, _ = self._parse_contents(contents)
-            return updated_contents
+            return list(self._iter_contents(contents))
 
         return None
 
@@ -434,7 +731,7 @@ class Channel(Playlist):
         if self._about_html:
             return self._about_html
         else:
-            self._about_html = request.get(self.about_url)
+            self._about_html = self._get_section("about")
             return self._about_html
 
     @property
@@ -448,48 +745,157 @@ class Channel(Playlist):
         if self._shorts_html:
             return self._shorts_html
         else:
-            self._shorts_html = request.get(self.shorts_url)
+            self._shorts_html = self._get_section("shorts")
             return self._shorts_html
 
-    def search_videos(self, query, continuation_token=None):
+    def prefetch(self, sections=_SECTIONS):
+        """Download the html of several channel sections concurrently.
+
+        The pages are stored in the same caches the ``*_html`` properties
+        read from, so accessing them afterwards does not issue a request.
+        Sections which have already been downloaded are skipped.
+
+        :param sections:
+            (Optional) Names of the sections to download, any of "videos",
+            "about", "shorts", "playlists", "community" and "channels".
+            Defaults to all of them.
+        """
+        pending = [
+            section for section in sections if not getattr(self, _PAGES[section][1])
+        ]
+        if not pending:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(6, len(pending))) as executor:
+            futures = {
+                executor.submit(self._get_section, section): section
+                for section in pending
+            }
+            for future in as_completed(futures):
+                setattr(self, _PAGES[futures[future]][1], future.result())
+
+    async def prefetch_async(self, sections=_SECTIONS):
+        """Awaitable version of :meth:`prefetch`.
+
+        The downloads run in the event loop's default executor, so the loop
+        is not blocked while they complete.
+
+        :param sections:
+            (Optional) Names of the sections to download, see :meth:`prefetch`.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.prefetch, sections)
+
+    def _ensure_innertube(self):
         if not self.innertube:
             self.innertube = InnerTube(
                 client="WEB",
                 use_oauth=self.use_oauth,
                 allow_cache=self.allow_oauth_cache,
             )
-        response = self.innertube.browse(
-            self.channel_id, query=query, continuation_token=continuation_token
-        )
+        return self.innertube
+
+    def _parse_search_response(self, response):
         if response:
             contents = self._find_searched_content_list(response)
             if contents:
-                updated_contents, continuation_token = self._parse_contents(contents)
-                return updated_contents, continuation_token
+                return self._parse_contents(contents)
         return None, None
 
-    def text_to_number(self, text):
-        # Define a dictionary mapping suffixes to their multiplication factors
-        suffixes = {"K": 1e3, "M": 1e6, "B": 1e9, "T": 1e12}
+    def _browse(self, query, continuation_token=None):
+        return self._ensure_innertube().browse(
+            self.channel_id, query=query, continuation_token=continuation_token
+        )
+
+    def _search_page(self, query, response, prefetch=True):
+        videos, continuation_token = self._parse_search_response(response)
+        future = None
+        if continuation_token and prefetch:
+            if self._prefetch_executor is None:
+                self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+            future = self._prefetch_executor.submit(self._browse, query, continuation_token)
+        return SearchPage(self, query, videos, continuation_token, future)
+
+    def search_videos(self, query, continuation_token=None, prefetch=False):
+        """Search the videos of the channel.
+
+        :param str query:
+            The search query.
+        :param str continuation_token:
+            (Optional) Token of the result page to request, as returned
+            with the previous page.
+        :param bool prefetch:
+            (Optional) Return a :class:`SearchPage` and start requesting the
+            page after it in the background, so fetching it overlaps with the
+            caller processing this one. Defaults to False.
+        :rtype: tuple or SearchPage
+        :returns:
+            The videos found and the token of the next page.
+        """
+        response = self._browse(query, continuation_token)
+        if prefetch:
+            return self._search_page(query, response)
+        return self._parse_search_response(response)
+
+    def search_videos_iter(self, query, max_pages=None):
+        """Yield the videos matching a channel search, page after page.
+
+        The next page of results is requested in the background as soon as
+        the current page has been parsed, so fetching it overlaps with the
+        caller consuming the current one, see :class:`SearchPage`.
+
+        :param str query:
+            The search query.
+        :param int max_pages:
+            (Optional) Maximum number of result pages to request.
+        :rtype: Iterator[dict]
+        """
+        pages = 1
+        page = self._search_page(
+            query, self._browse(query), prefetch=max_pages is None or max_pages > 1
+        )
+        try:
+            while page is not None and page.videos:
+                yield from page.videos
+                if max_pages is not None and pages >= max_pages:
+                    return
+                pages += 1
+                page = page.next_page(prefetch=max_pages is None or pages < max_pages)
+        finally:
+            # Don't leave the prefetch of a page nobody will read queued up
+            if page is not None and page._future is not None:
+                page._future.cancel()
+
+    def close(self):
+        """Shut down the background thread used to prefetch search pages.
+
+        Requests still in flight are left to finish on their own.
+        """
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
 
-        # Check if the last character of the input text is one of the suffixes
-        if text[-1] in suffixes:
-            # Extract the number part and the suffix
-            number, suffix = text[:-1], text[-1]
+    def __enter__(self):
+        return self
 
-            # Try converting the number part to float and multiply by the corresponding factor
-            try:
-                return float(number) * suffixes[suffix]
-            except ValueError:
-                # Return an error message if conversion fails
-                return "Error: The number part could not be converted to float."
-        else:
-            # If there's no suffix, try converting the text directly to float
-            try:
-                return float(text)
-            except ValueError:
-                # Return an error message if conversion fails
-                return "Error: The input could not be converted to float."
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def text_to_number(text):
+        """Convert an abbreviated count such as "1.2M" into a number.
+
+        :rtype: float or None
+        :returns:
+            None if the text is not a (suffixed) number.
+        """
+        multiplier = _SUFFIXES.get(text[-1])
+        try:
+            if multiplier:
+                return float(text[:-1]) * multiplier
+            return float(text)
+        except ValueError:
+            return None
 
     @property
     def subscriber_count(self):
@@ -497,25 +903,26 @@ class Channel(Playlist):
 
         :rtype: str
         """
+        if self._subscriber_count is not None:
+            return self._subscriber_count
         try:
-            return self.text_to_number(
+            self._subscriber_count = self.text_to_number(
                 self.about_metadata_json["subscriberCountText"].split(" ")[0]
             )
+            return self._subscriber_count
 
-        except:
+        except (KeyError, IndexError, TypeError):
             return None
 
     @property
     def country(self):
-        """Get the video count for the channel.
+        """Get the country for the channel.
 
         :rtype: str
         """
-        try:
-            return self.about_metadata_json["country"]
-
-        except:
-            return None
+        if self._country is None:
+            self._country = (self.about_metadata_json or {}).get("country")
+        return self._country
 
     @property
     def video_count(self):
@@ -523,18 +930,22 @@ class Channel(Playlist):
 
         :rtype: str
         """
+        if self._video_count is not None:
+            return self._video_count
         try:
-            return int(
+            self._video_count = int(
                 self.about_metadata_json["videoCountText"]
-                .split(" videos")[0]
+                .split(" ", 1)[0]
                 .replace(",", "")
             )
+            return self._video_count
         except:
             return None
 
-    def extract_ytcfg_json(self, html):
+    @staticmethod
+    def extract_ytcfg_json(html):
         """
-        Extracts the JSON object from a script tag that contains 'ytcfg.set(' in a given HTML string using regular expressions.
+        Extracts the JSON object passed to 'ytcfg.set(' in a given HTML string.
 
         Args:
         html (str): The HTML string to parse.
@@ -542,29 +953,35 @@ class Channel(Playlist):
         Returns:
         dict: The extracted JSON object, or None if no matching script tag is found.
         """
-        # Define a regex pattern to find 'ytcfg.set({<json_here>})'
-        pattern = r"ytcfg.set\((\{.*?\})\);"
-
-        # Search for the pattern in the HTML
-        match = re.search(pattern, html, re.DOTALL)
-
-        if match:
-            # Extract the JSON string
-            json_str = match.group(1)
-
+        # Try every 'ytcfg.set({<json_here>})' call in turn, decoding just the
+        # object that follows it, until one of them holds valid JSON
+        decoder = json.JSONDecoder()
+        index = html.find(_YTCFG_ANCHOR)
+
+        while index != -1:
+            start = index + len(_YTCFG_ANCHOR)
+            if html.startswith("{", start):
+                try:
+                    json_data, _ = decoder.raw_decode(html, start)
+                    return json_data
+                except json.JSONDecodeError:
+                    logger.debug("Error decoding ytcfg JSON", exc_info=True)
+            index = html.find(_YTCFG_ANCHOR, start)
+
+        # Fall back to a pattern that tolerates whitespace before the object
+        for match in _YTCFG_RE.finditer(html):
             try:
-                # Convert JSON string to a Python dictionary
-                json_data = json.loads(json_str)
+                json_data, _ = decoder.raw_decode(html, match.end())
                 return json_data
-            except json.JSONDecodeError as e:
-                print("Error decoding JSON: ", e)
-                return None
-        else:
-            print("No 'ytcfg.set()' found in the HTML.")
-            return None
+            except json.JSONDecodeError:
+                logger.debug("Error decoding ytcfg JSON", exc_info=True)
+
+        logger.debug("No 'ytcfg.set()' found in the HTML.")
+        return None
 
     # TODO: does this already exist in extract.initial_data??
-    def extract_yt_initial_data(self, html):
+    @staticmethod
+    def extract_yt_initial_data(html):
         """
         Extracts the ytInitialData JSON from HTML content and converts it to a Python dictionary.
 
@@ -575,13 +992,29 @@ class Channel(Playlist):
         dict: The extracted JSON data as a Python dictionary or None if the JSON data could not be found.
         """
         if html:
-            pattern = r"var ytInitialData = ({.*?});</script>"
-            match = re.search(pattern, html, re.DOTALL)
+            index = html.find(_YT_INITIAL_DATA_ANCHOR)
+            if index != -1:
+                start = index + len(_YT_INITIAL_DATA_ANCHOR)
+                # The object normally runs up to the end of its script tag,
+                # which lets the (possibly faster) _json_loads parse it
+                end = html.find(";</script>", start)
+                if end != -1:
+                    try:
+                        return _json_loads(html[start:end])
+                    except ValueError:
+                        pass
+
+                # raw_decode stops at the end of the object, so the rest of
+                # the page is never scanned
+                json_data, _ = json.JSONDecoder().raw_decode(html, start)
+                return json_data
+
+            # Fall back to a pattern that tolerates other spacing around '='
+            match = _YT_INITIAL_DATA_RE.search(html)
             if not match:
                 raise ValueError("ytInitialData not found in the provided HTML.")
 
-            json_data = json.loads(match.group(1))
-
+            json_data, _ = json.JSONDecoder().raw_decode(html, match.end())
             return json_data
         return None
 
@@ -595,63 +1028,31 @@ class Channel(Playlist):
         :returns: Tuple containing a list of up to 100 video watch ids and
             a continuation token, if more videos are available
         """
-        initial_data = json.loads(raw_json)
-        # this is the json tree structure, if the json was extracted from
-        # html
-        try:
-            videos = initial_data["contents"]["twoColumnBrowseResultsRenderer"]["tabs"][
-                1
-            ]["tabRenderer"]["content"]["sectionListRenderer"]["contents"][0][
-                "itemSectionRenderer"
-            ][
-                "contents"
-            ][
-                0
-            ][
-                "gridRenderer"
-            ][
-                "items"
-            ]
-        except (KeyError, IndexError, TypeError):
+        initial_data = _json_loads(raw_json)
+        for path in _VIDEOS_PATHS:
             try:
-                # this is the json tree structure, if the json was directly sent
-                # by the server in a continuation response
-                important_content = initial_data[1]["response"][
-                    "onResponseReceivedActions"
-                ][0]["appendContinuationItemsAction"]["continuationItems"]
-                videos = important_content
-            except (KeyError, IndexError, TypeError):
-                try:
-                    # this is the json tree structure, if the json was directly sent
-                    # by the server in a continuation response
-                    # no longer a list and no longer has the "response" key
-                    important_content = initial_data["onResponseReceivedActions"][0][
-                        "appendContinuationItemsAction"
-                    ]["continuationItems"]
-                    videos = important_content
-                except (KeyError, IndexError, TypeError) as p:
-                    logger.info(p)
-                    return [], None
+                videos = _walk(initial_data, path)
+                break
+            except (KeyError, IndexError, TypeError) as p:
+                error = p
+        else:
+            logger.info(error)
+            return [], None
 
         try:
             continuation = videos[-1]["continuationItemRenderer"][
                 "continuationEndpoint"
             ]["continuationCommand"]["token"]
-            videos = videos[:-1]
         except (KeyError, IndexError):
             # if there is an error, no continuation is available
             continuation = None
 
-        # remove duplicates
-        return (
-            uniqueify(
-                list(
-                    # only extract the video ids from the video data
-                    map(
-                        lambda x: (f"/watch?v=" f"{x['gridVideoRenderer']['videoId']}"),
-                        videos,
-                    )
-                ),
-            ),
-            continuation,
+        # only extract the video ids from the video data, which also skips the
+        # trailing continuation item; dict.fromkeys removes duplicates in order,
+        # so the watch path is only built once per unique id
+        video_ids = dict.fromkeys(
+            video["gridVideoRenderer"]["videoId"]
+            for video in videos
+            if "gridVideoRenderer" in video
         )
+        return list(map("/watch?v=".__add__, video_ids)), continuation
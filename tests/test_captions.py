@@ -1,3 +1,4 @@
+import io
 import os
 import pytest
 from unittest import mock
@@ -11,6 +12,13 @@ def test_float_to_srt_time_format():
         {"url": "url1", "name": {"simpleText": "name1"}, "languageCode": "en", "vssId": ".en"}
     )
     assert caption1.float_to_srt_time_format(3.89) == "00:00:03,890"
+    assert caption1.float_to_srt_time_format(59.9996) == "00:01:00,000"
+    assert caption1.float_to_srt_time_format(3723.004) == "01:02:03,004"
+
+
+def test_fmt_ms():
+    assert Caption._fmt_ms(3890) == "00:00:03,890"
+    assert Caption._fmt_ms(3723004) == "01:02:03,004"
 
 
 def test_caption_query_sequence():
@@ -52,11 +60,11 @@ def test_caption_query_get_by_language_code_when_not_exists():
         # assert not_found is not None  # should never reach here
 
 
-@mock.patch("pytube.captions.Caption.generate_srt_captions")
+@mock.patch("pytube.captions.Caption.write_srt")
 def test_download(srt):
     open_mock = mock_open()
     with patch("builtins.open", open_mock):
-        srt.return_value = ""
+        srt.return_value = None
         caption = Caption(
             {
                 "url": "url1",
@@ -71,11 +79,11 @@ def test_download(srt):
         )
 
 
-@mock.patch("pytube.captions.Caption.generate_srt_captions")
+@mock.patch("pytube.captions.Caption.write_srt")
 def test_download_with_prefix(srt):
     open_mock = mock_open()
     with patch("builtins.open", open_mock):
-        srt.return_value = ""
+        srt.return_value = None
         caption = Caption(
             {
                 "url": "url1",
@@ -91,12 +99,12 @@ def test_download_with_prefix(srt):
         )
 
 
-@mock.patch("pytube.captions.Caption.generate_srt_captions")
+@mock.patch("pytube.captions.Caption.write_srt")
 def test_download_with_output_path(srt):
     open_mock = mock_open()
     captions.target_directory = MagicMock(return_value="/target")
     with patch("builtins.open", open_mock):
-        srt.return_value = ""
+        srt.return_value = None
         caption = Caption(
             {
                 "url": "url1",
@@ -167,3 +175,79 @@ def test_generate_srt_captions(request):
         "00:00:08,300 --> 00:00:11,000\n"
         "如要啓動字幕，請按一下這裡的圖示。"
     )
+
+
+def test_unescape():
+    assert captions._unescape("plain text") == "plain text"
+    assert captions._unescape("it&#39;s &quot;R&amp;D&quot;") == 'it\'s "R&D"'
+    assert captions._unescape("&amp;lt;b&amp;gt;") == "&lt;b&gt;"
+    assert captions._unescape("caf&eacute; &#x27;") == "café '"
+
+
+@mock.patch("pytube.captions.request")
+def test_write_srt(request):
+    request.get.return_value = (
+        '<?xml version="1.0" encoding="utf-8" ?><transcript><text start="6.5" dur="1.7">'
+        "Sé&amp;lt;</text><text start=\"8.3\" dur=\"2.7\">done</text></transcript>"
+    )
+    caption = Caption(
+        {"url": "url1", "name": {"simpleText": "name1"}, "languageCode": "en", "vssId": ".en"}
+    )
+    file_handle = io.BytesIO()
+    caption.write_srt(file_handle)
+    assert file_handle.getvalue() == caption.generate_srt_captions().encode("utf-8")
+    assert file_handle.getvalue().decode("utf-8") == (
+        "1\n00:00:06,500 --> 00:00:08,200\nSé<\n\n2\n00:00:08,300 --> 00:00:11,000\ndone"
+    )
+
+
+@mock.patch("pytube.captions.request")
+def test_write_srt_matches_generate_srt_captions(request):
+    request.get.return_value = (
+        '<?xml version="1.0" encoding="utf-8" ?><transcript><text start="6.5" dur="1.7">'
+        "first </text><text start=\"8.3\" dur=\"2.7\">last \n</text></transcript>"
+    )
+    caption = Caption(
+        {"url": "url1", "name": {"simpleText": "name1"}, "languageCode": "en", "vssId": ".en"}
+    )
+    file_handle = io.BytesIO()
+    caption.write_srt(file_handle)
+    assert file_handle.getvalue() == caption.generate_srt_captions().encode("utf-8")
+    assert file_handle.getvalue().endswith(b"\nlast")
+
+
+def test_xml_caption_to_srt_ignores_external_entities(tmp_path):
+    secret = tmp_path / "secret.txt"
+    secret.write_text("top secret")
+    xml = (
+        '<?xml version="1.0" encoding="utf-8" ?>'
+        f'<!DOCTYPE transcript [<!ENTITY xxe SYSTEM "{secret.as_uri()}">]>'
+        '<transcript><text start="1" dur="1">a &xxe; b</text></transcript>'
+    )
+    caption = Caption(
+        {"url": "url1", "name": {"simpleText": "name1"}, "languageCode": "en", "vssId": ".en"}
+    )
+    assert "top secret" not in (caption.xml_caption_to_srt(xml) or "")
+
+
+@mock.patch("pytube.captions.request")
+def test_generate_srt_captions_timedtext_format(request):
+    request.get.return_value = (
+        '<?xml version="1.0" encoding="utf-8" ?><timedtext format="3"><body>'
+        '<p t="0" d="1500">Hello &amp;amp; welcome</p>'
+        '<p t="1500" d="0">\n</p>'
+        '<p t="3723004" d="2000"><s>it&#39;s</s><s t="400"> late</s></p>'
+        "</body></timedtext>"
+    )
+    caption = Caption(
+        {"url": "url1", "name": {"simpleText": "name1"}, "languageCode": "en", "vssId": ".en"}
+    )
+    assert caption.generate_srt_captions() == (
+        "1\n"
+        "00:00:00,000 --> 00:00:01,500\n"
+        "Hello & welcome\n"
+        "\n"
+        "2\n"
+        "01:02:03,004 --> 01:02:05,004\n"
+        "it's late"
+    )